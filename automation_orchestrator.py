@@ -8,13 +8,17 @@ import os
 import sys
 import json
 import time
-import subprocess
-import threading
+import asyncio
 import logging
-from datetime import datetime
 from pathlib import Path
 import signal
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json if orjson not available
+    orjson = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,28 +31,74 @@ logging.basicConfig(
 logger = logging.getLogger('AutomationOrchestrator')
 
 
+def _write_json(path, data):
+    """Write data to path as indented JSON"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_json(path):
+    """Parse a JSON file"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class AutomationOrchestrator:
     """Master orchestrator for complete automation"""
     
     def __init__(self):
-        self.running = True
         self.services = {}
         self.revenue_streams = []
         self.agent_workflows = []
         self.repos_managed = []
-        
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        self._tasks = []
+        self._jobs = []
+        self._stop = None  # events are created in _main, on the running loop
+        self._state_changed = None
+        self._disk_usage = None
+        self._disk_checked_at = 0.0
+        
+        # Resolve the scripts directory once instead of on every call
+        self._script_dir = Path('profitable_scripts').resolve()
+        self._script_dir_ok = self._script_dir.is_dir()
+        self._revenue_file = self._script_dir / 'revenue_analytics_report.json'
+        self._revenue_mtime = None
+        self._revenue_cache = None
+        
+        # Prime the CPU counter so later non-blocking reads have a baseline
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
         
         logger.info("🚀 Automation Orchestrator initialized")
     
-    def signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully"""
-        logger.info(f"\n⚠️  Received signal {signum}. Shutting down gracefully...")
-        self.running = False
-        self.stop_all_services()
-        sys.exit(0)
+    def signal_handler(self, signum):
+        """Shut down gracefully on the first signal and immediately on the second"""
+        if self._stop.is_set():
+            logger.error("❌ Received signal %s again. Forcing exit...", signum)
+            for service_info in self.services.values():
+                process = service_info.get('process')
+                if process is not None and process.returncode is None:
+                    process.kill()
+            logging.shutdown()
+            os._exit(1)
+        
+        logger.info("\n⚠️  Received signal %s. Shutting down gracefully...", signum)
+        self._stop.set()
+    
+    async def _wait_for_stop(self, timeout):
+        """Sleep for up to `timeout` seconds, waking early on shutdown"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     def setup_repository_automation(self):
         """Automate repository creation and setup"""
@@ -66,77 +116,88 @@ class AutomationOrchestrator:
             ]
         }
         
-        # Save configuration
-        with open('repo_automation_config.json', 'w') as f:
-            json.dump(repo_config, f, indent=2)
-        
         logger.info("✅ Repository automation configured")
         return repo_config
     
-    def start_deployment_system(self):
+    async def start_deployment_system(self):
         """Start the 100-instance deployment system"""
         logger.info("🎯 Starting deployment system...")
         
         try:
             # Change to profitable_scripts directory
-            script_dir = Path('profitable_scripts')
-            if not script_dir.exists():
+            if not self._script_dir_ok:
                 logger.error("❌ profitable_scripts directory not found")
                 return None
             
             # Start deployment manager
-            process = subprocess.Popen(
-                [sys.executable, 'deployment_manager.py'],
-                cwd=str(script_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, 'deployment_manager.py',
+                cwd=str(self._script_dir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
             
             self.services['deployment_manager'] = {
                 'process': process,
-                'started_at': datetime.now().isoformat(),
+                'started_at_ns': time.monotonic_ns(),
                 'status': 'running'
             }
+            self._forward_output('deployment_manager', process)
             
             logger.info("✅ Deployment system started")
             return process
             
         except Exception as e:
-            logger.error(f"❌ Failed to start deployment system: {e}")
+            logger.error("❌ Failed to start deployment system: %s", e)
             return None
     
-    def start_revenue_dashboard(self):
+    async def start_revenue_dashboard(self):
         """Start revenue monitoring dashboard"""
         logger.info("📊 Starting revenue dashboard...")
         
         try:
-            script_dir = Path('profitable_scripts')
-            if not script_dir.exists():
+            if not self._script_dir_ok:
                 logger.error("❌ profitable_scripts directory not found")
                 return None
             
-            process = subprocess.Popen(
-                [sys.executable, 'revenue_dashboard.py'],
-                cwd=str(script_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, 'revenue_dashboard.py',
+                cwd=str(self._script_dir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
             
             self.services['revenue_dashboard'] = {
                 'process': process,
-                'started_at': datetime.now().isoformat(),
+                'started_at_ns': time.monotonic_ns(),
                 'status': 'running'
             }
+            self._forward_output('revenue_dashboard', process)
             
             logger.info("✅ Revenue dashboard started")
             return process
             
         except Exception as e:
-            logger.error(f"❌ Failed to start revenue dashboard: {e}")
+            logger.error("❌ Failed to start revenue dashboard: %s", e)
             return None
     
+    async def _drain(self, stream, service_name):
+        """Log a child's output line by line so its pipe never fills up"""
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Overlong line, already discarded by the reader; keep draining
+                continue
+            if not line:
+                break
+            logger.info("[%s] %s", service_name, line.decode(errors='replace').rstrip())
+    
+    def _forward_output(self, service_name, process):
+        """Start draining a child's stdout and stderr into the logger"""
+        for stream in (process.stdout, process.stderr):
+            self._tasks.append(asyncio.create_task(self._drain(stream, service_name)))
+    
     def setup_agent_workflows(self):
         """Setup and start agent workflows"""
         logger.info("🤖 Setting up agent workflows...")
@@ -176,47 +237,37 @@ class AutomationOrchestrator:
         
         self.agent_workflows = workflows
         
-        # Save workflow configuration
-        with open('agent_workflows_config.json', 'w') as f:
-            json.dump(workflows, f, indent=2)
-        
-        logger.info(f"✅ {len(workflows)} agent workflows configured")
+        logger.info("✅ %d agent workflows configured", len(workflows))
         return workflows
     
+    async def _scale_once(self):
+        """Check system metrics once and scale instances accordingly"""
+        try:
+            # Check system metrics
+            metrics = self.collect_metrics()
+            
+            # Scale up if needed
+            if metrics.get('cpu_usage', 0) > 80:
+                logger.info("⚠️  High CPU usage detected, scaling up...")
+                # Scaling logic here
+            
+            # Scale down if underutilized
+            if metrics.get('cpu_usage', 0) < 20:
+                logger.info("ℹ️  Low CPU usage, optimizing resources...")
+                # Optimization logic here
+            
+        except Exception as e:
+            logger.error("❌ Scaling monitor error: %s", e)
+    
     def start_auto_scaling(self):
         """Start auto-scaling monitoring"""
         logger.info("📈 Starting auto-scaling system...")
         
-        def scaling_monitor():
-            """Monitor and scale instances based on performance"""
-            while self.running:
-                try:
-                    # Check system metrics
-                    metrics = self.collect_metrics()
-                    
-                    # Scale up if needed
-                    if metrics.get('cpu_usage', 0) > 80:
-                        logger.info("⚠️  High CPU usage detected, scaling up...")
-                        # Scaling logic here
-                    
-                    # Scale down if underutilized
-                    if metrics.get('cpu_usage', 0) < 20:
-                        logger.info("ℹ️  Low CPU usage, optimizing resources...")
-                        # Optimization logic here
-                    
-                    time.sleep(60)  # Check every minute
-                    
-                except Exception as e:
-                    logger.error(f"❌ Scaling monitor error: {e}")
-                    time.sleep(60)
-        
-        # Start scaling monitor in background thread
-        thread = threading.Thread(target=scaling_monitor, daemon=True)
-        thread.start()
+        # Check every minute from the shared scheduler
+        self._jobs.append(('scaling', 60, self._scale_once))
         
         self.services['auto_scaling'] = {
-            'thread': thread,
-            'started_at': datetime.now().isoformat(),
+            'started_at_ns': time.monotonic_ns(),
             'status': 'running'
         }
         
@@ -226,46 +277,52 @@ class AutomationOrchestrator:
         """Collect system metrics"""
         try:
             import psutil
+            
+            # Disk usage barely moves, so only re-read it once a minute
+            now = time.monotonic()
+            if self._disk_usage is None or now - self._disk_checked_at >= 60:
+                self._disk_usage = psutil.disk_usage('/').percent
+                self._disk_checked_at = now
+            
             metrics = {
-                'cpu_usage': psutil.cpu_percent(interval=1),
+                # Non-blocking: usage since the previous call
+                'cpu_usage': psutil.cpu_percent(interval=None),
                 'memory_usage': psutil.virtual_memory().percent,
-                'disk_usage': psutil.disk_usage('/').percent,
-                'timestamp': datetime.now().isoformat()
+                'disk_usage': self._disk_usage
             }
             return metrics
         except ImportError:
             # Fallback if psutil not available
             return {'cpu_usage': 50, 'memory_usage': 50, 'disk_usage': 50}
     
+    async def _supervise(self, service_name, service_info):
+        """Wait for a managed child to exit and mark it as stopped"""
+        returncode = await service_info['process'].wait()
+        if not self._stop.is_set():
+            logger.warning("⚠️  Service %s stopped (exit code %s), restarting...", service_name, returncode)
+            # Restart logic here
+        service_info['status'] = 'stopped'
+        self._state_changed.set()
+    
+    async def _health_checker(self):
+        """Monitor health of all services"""
+        await asyncio.gather(*[
+            self._supervise(service_name, service_info)
+            for service_name, service_info in self.services.items()
+            if 'process' in service_info
+        ])
+    
     def start_health_monitoring(self):
         """Start health monitoring for all services"""
         logger.info("🏥 Starting health monitoring...")
         
-        def health_checker():
-            """Monitor health of all services"""
-            while self.running:
-                try:
-                    for service_name, service_info in self.services.items():
-                        if 'process' in service_info:
-                            process = service_info['process']
-                            if process.poll() is not None:
-                                logger.warning(f"⚠️  Service {service_name} stopped, restarting...")
-                                # Restart logic here
-                                service_info['status'] = 'stopped'
-                    
-                    time.sleep(30)  # Check every 30 seconds
-                    
-                except Exception as e:
-                    logger.error(f"❌ Health monitor error: {e}")
-                    time.sleep(30)
-        
-        # Start health monitor in background thread
-        thread = threading.Thread(target=health_checker, daemon=True)
-        thread.start()
+        # Schedule health checker on the event loop
+        task = asyncio.create_task(self._health_checker(), name="health")
+        self._tasks.append(task)
         
         self.services['health_monitor'] = {
-            'thread': thread,
-            'started_at': datetime.now().isoformat(),
+            'task': task,
+            'started_at_ns': time.monotonic_ns(),
             'status': 'running'
         }
         
@@ -282,43 +339,35 @@ class AutomationOrchestrator:
             'backup_instances': 5
         }
         
-        with open('recovery_config.json', 'w') as f:
-            json.dump(recovery_config, f, indent=2)
-        
         logger.info("✅ Automated recovery configured")
         return recovery_config
     
+    async def _profit_once(self):
+        """Optimize revenue across all streams once"""
+        try:
+            # Analyze revenue streams (file I/O, so keep it off the event loop)
+            loop = asyncio.get_running_loop()
+            revenue_data = await loop.run_in_executor(None, self.analyze_revenue_streams)
+            
+            # Optimize allocations
+            if revenue_data:
+                logger.info("💵 Current total revenue: $%.2f", revenue_data.get('total', 0))
+                
+                # Reallocate resources to most profitable streams
+                self.optimize_resource_allocation(revenue_data)
+            
+        except Exception as e:
+            logger.error("❌ Profit optimizer error: %s", e)
+    
     def start_profit_maximizer(self):
         """Start profit maximization algorithms"""
         logger.info("💰 Starting profit maximization system...")
         
-        def profit_optimizer():
-            """Optimize revenue across all streams"""
-            while self.running:
-                try:
-                    # Analyze revenue streams
-                    revenue_data = self.analyze_revenue_streams()
-                    
-                    # Optimize allocations
-                    if revenue_data:
-                        logger.info(f"💵 Current total revenue: ${revenue_data.get('total', 0):.2f}")
-                        
-                        # Reallocate resources to most profitable streams
-                        self.optimize_resource_allocation(revenue_data)
-                    
-                    time.sleep(300)  # Optimize every 5 minutes
-                    
-                except Exception as e:
-                    logger.error(f"❌ Profit optimizer error: {e}")
-                    time.sleep(300)
-        
-        # Start profit optimizer in background thread
-        thread = threading.Thread(target=profit_optimizer, daemon=True)
-        thread.start()
+        # Optimize every 5 minutes from the shared scheduler
+        self._jobs.append(('profit', 300, self._profit_once))
         
         self.services['profit_maximizer'] = {
-            'thread': thread,
-            'started_at': datetime.now().isoformat(),
+            'started_at_ns': time.monotonic_ns(),
             'status': 'running'
         }
         
@@ -328,13 +377,19 @@ class AutomationOrchestrator:
         """Analyze all revenue streams"""
         try:
             # Check for revenue data
-            revenue_file = Path('profitable_scripts/revenue_analytics_report.json')
-            if revenue_file.exists():
-                with open(revenue_file, 'r') as f:
-                    return json.load(f)
+            if not self._script_dir_ok:
+                return None
+            
+            # Only re-parse the report when the dashboard has rewritten it
+            mtime = self._revenue_file.stat().st_mtime_ns
+            if mtime != self._revenue_mtime:
+                self._revenue_cache = _read_json(self._revenue_file)
+                self._revenue_mtime = mtime
+            return self._revenue_cache
+        except FileNotFoundError:
             return None
         except Exception as e:
-            logger.error(f"❌ Error analyzing revenue: {e}")
+            logger.error("❌ Error analyzing revenue: %s", e)
             return None
     
     def optimize_resource_allocation(self, revenue_data):
@@ -354,9 +409,6 @@ class AutomationOrchestrator:
             'revenue_tracking': True
         }
         
-        with open('unified_dashboard_config.json', 'w') as f:
-            json.dump(dashboard_config, f, indent=2)
-        
         logger.info("✅ Unified dashboard created")
         return dashboard_config
     
@@ -371,96 +423,161 @@ class AutomationOrchestrator:
             'quality_gates': ['tests_pass', 'coverage_threshold', 'no_security_issues']
         }
         
-        with open('cicd_automation_config.json', 'w') as f:
-            json.dump(ci_cd_config, f, indent=2)
-        
         logger.info("✅ CI/CD automation configured")
         return ci_cd_config
     
-    def start_all_systems(self):
+    async def _write_all_configs(self, configs):
+        """Write every config file concurrently, off the event loop"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(None, _write_json, path, data)
+            for path, data in configs.items()
+        ])
+    
+    async def start_all_systems(self):
         """Start all automation systems"""
         logger.info("🚀 Starting complete automation system...")
         logger.info("=" * 80)
         
         # Setup repository automation
-        self.setup_repository_automation()
+        configs = {'repo_automation_config.json': self.setup_repository_automation()}
         
         # Setup agent workflows
-        self.setup_agent_workflows()
-        
-        # Start deployment system
-        self.start_deployment_system()
+        configs['agent_workflows_config.json'] = self.setup_agent_workflows()
         
-        # Start revenue dashboard
-        time.sleep(2)  # Brief delay
-        self.start_revenue_dashboard()
+        # Start deployment system and revenue dashboard; they don't depend on each other
+        await asyncio.gather(
+            self.start_deployment_system(),
+            self.start_revenue_dashboard()
+        )
         
         # Start monitoring systems
         self.start_health_monitoring()
         self.start_auto_scaling()
         
         # Setup recovery
-        self.setup_automated_recovery()
+        configs['recovery_config.json'] = self.setup_automated_recovery()
         
         # Start profit maximization
         self.start_profit_maximizer()
         
         # Create unified dashboard
-        self.create_unified_dashboard()
+        configs['unified_dashboard_config.json'] = self.create_unified_dashboard()
         
         # Setup CI/CD
-        self.setup_ci_cd_automation()
+        configs['cicd_automation_config.json'] = self.setup_ci_cd_automation()
+        
+        # Save all configuration files in one pass
+        await self._write_all_configs(configs)
         
         logger.info("=" * 80)
         logger.info("✅ Complete automation system started!")
-        logger.info(f"📊 Active services: {len(self.services)}")
-        logger.info(f"🤖 Agent workflows: {len(self.agent_workflows)}")
+        logger.info("📊 Active services: %d", len(self.services))
+        logger.info("🤖 Agent workflows: %d", len(self.agent_workflows))
         logger.info("💰 Revenue generation: ACTIVE")
         logger.info("🔄 Auto-scaling: ENABLED")
         logger.info("🏥 Health monitoring: ACTIVE")
         logger.info("🎯 Profit maximization: RUNNING")
         logger.info("=" * 80)
     
-    def stop_all_services(self):
+    async def stop_all_services(self):
         """Stop all running services"""
         logger.info("🛑 Stopping all services...")
         
-        for service_name, service_info in self.services.items():
+        processes = [
+            (service_name, service_info['process'])
+            for service_name, service_info in self.services.items()
+            if 'process' in service_info and service_info['process'].returncode is None
+        ]
+        
+        # Signal every child at once, then give them a shared 5 second grace period.
+        # Nothing is killed: deployment_manager stops its instances one by one on
+        # SIGTERM, and killing it mid-cleanup would orphan the rest.
+        for service_name, process in processes:
             try:
-                if 'process' in service_info:
-                    process = service_info['process']
-                    if process.poll() is None:
-                        process.terminate()
-                        process.wait(timeout=5)
-                        logger.info(f"✅ Stopped {service_name}")
+                process.terminate()
             except Exception as e:
-                logger.error(f"❌ Error stopping {service_name}: {e}")
+                logger.error("❌ Error stopping %s: %s", service_name, e)
+        
+        if processes:
+            await asyncio.wait(
+                [asyncio.create_task(process.wait()) for _, process in processes],
+                timeout=5
+            )
+        
+        for service_name, process in processes:
+            if process.returncode is None:
+                logger.warning("⚠️  %s still shutting down after 5s; leaving it to finish", service_name)
+            else:
+                logger.info("✅ Stopped %s", service_name)
         
         logger.info("✅ All services stopped")
     
-    def run(self):
-        """Main run loop"""
+    async def _scheduler(self):
+        """Run every periodic job from a single 10 second tick"""
+        loop = asyncio.get_running_loop()
+        last_run = {name: None for name, _, _ in self._jobs}
+        
+        while not self._stop.is_set():
+            now = loop.time()
+            for name, interval, job in self._jobs:
+                if last_run[name] is None or now - last_run[name] >= interval:
+                    last_run[name] = now
+                    await job()
+            
+            await self._wait_for_stop(10)
+    
+    async def _report_status(self):
+        """Log how many services are running when that changes, plus a 5 minute heartbeat"""
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._state_changed.wait(), timeout=300)
+            except asyncio.TimeoutError:
+                pass
+            self._state_changed.clear()
+            if self._stop.is_set():
+                break
+            
+            # Print status update
+            active_services = sum(1 for s in self.services.values() 
+                                if s.get('status') == 'running')
+            logger.info("📊 Status: %d/%d services running", active_services, len(self.services))
+    
+    async def _main(self):
+        """Start all systems and run every monitor on a single event loop"""
+        self._stop = asyncio.Event()
+        self._state_changed = asyncio.Event()
+        
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, self.signal_handler, signal.SIGINT)
+        loop.add_signal_handler(signal.SIGTERM, self.signal_handler, signal.SIGTERM)
+        
         try:
             # Start all systems
-            self.start_all_systems()
+            await self.start_all_systems()
             
             # Keep running
             logger.info("\n👀 Monitoring all systems... Press Ctrl+C to stop\n")
             
-            while self.running:
-                time.sleep(10)
-                
-                # Print status update
-                active_services = sum(1 for s in self.services.values() 
-                                    if s.get('status') == 'running')
-                logger.info(f"📊 Status: {active_services}/{len(self.services)} services running")
-                
+            self._tasks.append(asyncio.create_task(self._scheduler(), name="scheduler"))
+            self._tasks.append(asyncio.create_task(self._report_status(), name="status"))
+            await self._stop.wait()
+        finally:
+            self._stop.set()
+            self._state_changed.set()  # Wake the status reporter so it can exit
+            
+            # Children must exit before their supervisors and drains can finish
+            await self.stop_all_services()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    def run(self):
+        """Main run loop"""
+        try:
+            asyncio.run(self._main())
         except KeyboardInterrupt:
             logger.info("\n⚠️  Keyboard interrupt received")
-            self.stop_all_services()
         except Exception as e:
-            logger.error(f"❌ Fatal error: {e}")
-            self.stop_all_services()
+            logger.error("❌ Fatal error: %s", e)
             raise
 
 
@@ -29,6 +29,23 @@ def check_process_running(process_name):
         return False
 
 
+def scan_processes(process_names):
+    """Check which processes are running with a single process table scan"""
+    try:
+        import psutil
+    except ImportError:
+        # Fallback if psutil not available
+        return {name: check_process_running(name) for name in process_names}
+    
+    running = {name: False for name in process_names}
+    for process in psutil.process_iter(['cmdline']):
+        cmdline = ' '.join(process.info['cmdline'] or ())
+        for name in process_names:
+            if name in cmdline:
+                running[name] = True
+    return running
+
+
 def load_json_file(filepath):
     """Load JSON file if it exists"""
     if check_file_exists(filepath):
@@ -40,6 +57,20 @@ def load_json_file(filepath):
     return None
 
 
+def tail_lines(filepath, count=5, chunk_size=4096):
+    """Return the last `count` lines of a file, reading backwards from the end"""
+    with open(filepath, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        while position > 0 and data.count(b'\n') <= count:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    return [line.decode('utf-8', errors='replace') for line in data.splitlines()[-count:]]
+
+
 def print_header(title):
     """Print formatted header"""
     print("\n" + "=" * 70)
@@ -63,13 +94,19 @@ def main():
     # Check Core Services
     print_header("Core Services")
     
-    orchestrator_running = check_process_running('automation_orchestrator.py')
+    running = scan_processes([
+        'automation_orchestrator.py',
+        'deployment_manager.py',
+        'revenue_dashboard.py'
+    ])
+    
+    orchestrator_running = running['automation_orchestrator.py']
     print_status("Master Orchestrator", orchestrator_running)
     
-    deployment_running = check_process_running('deployment_manager.py')
+    deployment_running = running['deployment_manager.py']
     print_status("Deployment Manager", deployment_running)
     
-    dashboard_running = check_process_running('revenue_dashboard.py')
+    dashboard_running = running['revenue_dashboard.py']
     print_status("Revenue Dashboard", dashboard_running)
     
     # Check Configuration Files
@@ -130,12 +167,10 @@ def main():
     log_file = Path('automation_orchestrator.log')
     if log_file.exists():
         try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                recent_lines = lines[-5:] if len(lines) >= 5 else lines
-                print("\nLast 5 log entries:")
-                for line in recent_lines:
-                    print(f"  {line.strip()}")
+            recent_lines = tail_lines(log_file, 5)
+            print("\nLast 5 log entries:")
+            for line in recent_lines:
+                print(f"  {line.strip()}")
         except Exception as e:
             print(f"❌ Error reading log: {e}")
     else:
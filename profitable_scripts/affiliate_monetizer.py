@@ -3,10 +3,24 @@
 Affiliate Marketing Revenue Generator
 Automated affiliate link promotion and commission tracking
 """
-import time, random, json, os, requests
+import time, random, json, os, atexit, signal, sys, requests
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+    rng = np.random.default_rng()
+except ImportError:  # batch_simulate needs numpy; single campaigns don't
+    np = rng = None
+
 class AffiliateMonetizer:
+    SOCIAL_PLATFORMS = ('twitter', 'telegram', 'discord', 'reddit', 'youtube', 'medium')
+    PLATFORM_MULTIPLIERS = (1.2, 1.5, 1.1, 1.8, 2.0, 1.3)
+    
     def __init__(self):
         self.affiliate_programs = {
             'crypto_exchanges': [
@@ -38,9 +52,17 @@ class AffiliateMonetizer:
             "🎯 {product_name} Complete Guide - {benefits} + Exclusive Offer"
         ]
         
-        self.social_platforms = [
-            'twitter', 'telegram', 'discord', 'reddit', 'youtube', 'medium'
-        ]
+        # Flattened program table for batch_simulate
+        self.program_table = [(category, program)
+                              for category, programs in self.affiliate_programs.items()
+                              for program in programs]
+        
+        # Log handles stay open for the life of the process
+        self.campaign_log = open('affiliate_campaigns.jsonl', 'ab', buffering=65536)
+        self.revenue_log = open('affiliate_revenue_log.txt', 'ab', buffering=65536)
+        self.campaign_batch = []
+        self.batch_cap = 64  # bounds bursts of back-to-back saves; the run loop flushes when idle
+        atexit.register(self.close_logs)
     
     def generate_referral_content(self, program_category, affiliate_program):
         """Generate compelling affiliate content"""
@@ -108,18 +130,12 @@ class AffiliateMonetizer:
     
     def promote_on_platforms(self, content_data, performance_data):
         """Simulate promoting content across platforms"""
-        platforms_used = random.sample(self.social_platforms, random.randint(2, 4))
+        platforms_used = random.sample(range(len(self.SOCIAL_PLATFORMS)), random.randint(2, 4))
         
         promotion_results = []
-        for platform in platforms_used:
-            platform_multiplier = {
-                'twitter': 1.2,
-                'telegram': 1.5,
-                'discord': 1.1,
-                'reddit': 1.8,
-                'youtube': 2.0,
-                'medium': 1.3
-            }.get(platform, 1.0)
+        for i in platforms_used:
+            platform = self.SOCIAL_PLATFORMS[i]
+            platform_multiplier = self.PLATFORM_MULTIPLIERS[i]
             
             platform_commission = performance_data['total_commission'] * platform_multiplier * random.uniform(0.3, 0.8)
             
@@ -132,6 +148,40 @@ class AffiliateMonetizer:
         
         return promotion_results
     
+    def batch_simulate(self, n):
+        """Simulate n campaigns at once with vectorized draws (for backtesting)"""
+        if np is None:
+            raise ImportError("numpy is required for batch_simulate")
+        
+        commission_per_conversion = np.array([p['base_value'] * p['commission_rate']
+                                              for _, p in self.program_table])
+        platform_multipliers = np.array(self.PLATFORM_MULTIPLIERS)
+        
+        # Like run_affiliate_campaign: a random category, then a program within it
+        sizes = np.array([len(programs) for programs in self.affiliate_programs.values()])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        categories = rng.integers(0, len(sizes), n)
+        programs = offsets[categories] + (rng.random(n) * sizes[categories]).astype(np.int64)
+        expected_clicks = rng.integers(50, 501, n)
+        clicks = rng.integers(10, expected_clicks + 1)
+        conversions = (clicks * rng.uniform(0.02, 0.08, n)).astype(np.int64)
+        total_commission = conversions * commission_per_conversion[programs]
+        
+        # Pick 2-4 distinct platforms per campaign by ranking random keys
+        platform_count = rng.integers(2, 5, n)
+        ranks = rng.random((n, len(platform_multipliers))).argsort(axis=1).argsort(axis=1)
+        used = ranks < platform_count[:, None]
+        weights = platform_multipliers * rng.uniform(0.3, 0.8, used.shape)
+        total_revenue = total_commission * (weights * used).sum(axis=1)
+        
+        return {
+            'programs': programs,
+            'clicks': clicks,
+            'conversions': conversions,
+            'total_commission': total_commission,
+            'total_revenue': total_revenue
+        }
+    
     def run_affiliate_campaign(self):
         """Execute a complete affiliate marketing campaign"""
         # Select random program category and affiliate
@@ -165,10 +215,9 @@ class AffiliateMonetizer:
     
     def save_campaign_results(self, campaign):
         """Save campaign results and log revenue"""
-        filename = f"affiliate_campaign_{campaign['campaign_id']}.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(campaign, f, indent=2)
+        self.campaign_batch.append(campaign)
+        if len(self.campaign_batch) >= self.batch_cap:
+            self.flush_campaigns()
         
         revenue = campaign['total_revenue']
         
@@ -181,12 +230,40 @@ class AffiliateMonetizer:
         print(f"Platforms: {', '.join([r['platform'] for r in campaign['promotion_results']])}")
         
         # Log to revenue file
-        with open('affiliate_revenue_log.txt', 'a') as f:
-            f.write(f"{datetime.now().isoformat()},{campaign['affiliate_program']},{campaign['category']},{revenue:.2f},{campaign['performance']['conversions']}\n")
+        self.revenue_log.write(f"{datetime.now().isoformat()},{campaign['affiliate_program']},{campaign['category']},{revenue:.2f},{campaign['performance']['conversions']}\n".encode())
+        
+        # Dashboards tail the revenue log, so push each campaign out once
+        self.revenue_log.flush()
         
         return revenue
+    
+    def flush_campaigns(self):
+        """Write pending campaign records to the JSONL log in one call"""
+        if not self.campaign_batch:
+            return
+        if orjson is not None:
+            buf = b"\n".join(orjson.dumps(c) for c in self.campaign_batch)
+        else:
+            buf = "\n".join(json.dumps(c) for c in self.campaign_batch).encode()
+        self.campaign_log.write(buf + b"\n")
+        self.campaign_log.flush()
+        self.campaign_batch.clear()
+    
+    def close_logs(self):
+        """Flush and close the campaign and revenue logs"""
+        if not self.campaign_log.closed:
+            self.flush_campaigns()
+        for log in (self.campaign_log, self.revenue_log):
+            if not log.closed:
+                log.close()
+
+def exit_on_sigterm(signum, frame):
+    """Turn SIGTERM into a normal exit so atexit flushes the pending campaigns"""
+    sys.exit(0)
 
 def run_affiliate_monetizer():
+    # deployment_manager stops instances with SIGTERM, which would otherwise skip atexit
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
     monetizer = AffiliateMonetizer()
     total_revenue = 0
     campaign_count = 0
@@ -210,6 +287,9 @@ def run_affiliate_monetizer():
             print(f"Average Revenue per Campaign: ${total_revenue/campaign_count:.2f}")
             print("-" * 60)
             
+            # Nothing else arrives for hours, so don't leave the campaign in memory
+            monetizer.flush_campaigns()
+            
             # Wait before next campaign (1-3 hours)
             wait_time = random.randint(3600, 10800)
             print(f"Next campaign in {wait_time//3600:.1f} hours...")
@@ -3,149 +3,289 @@
 API Service Revenue Generator with Stripe Payment Processing
 Creates and monetizes API services for various data and functionality
 """
-import time, json, random, os, threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+import time, json, random, os, threading, atexit, queue
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+from email.utils import formatdate
 import socket
+from collections import Counter, deque
 from stripe_payment_processor import StripePaymentProcessor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _jsonize(obj):
+    """Encoder fallback for numpy scalars"""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+_DUMPS_OPTS = orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+
+def _dumps(obj, indent=False):
+    """Encode obj as JSON bytes"""
+    if orjson is not None:
+        option = _DUMPS_OPTS | orjson.OPT_INDENT_2 if indent else _DUMPS_OPTS
+        return orjson.dumps(obj, default=_jsonize, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_jsonize).encode()
+
+def _loads(data):
+    """Decode JSON from bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_date_cache = (None, b'')
+
+def _http_date():
+    """HTTP Date header value, formatted at most once per second"""
+    global _date_cache
+    now = int(time.time())
+    if _date_cache[0] != now:
+        _date_cache = (now, formatdate(now, usegmt=True).encode())
+    return _date_cache[1]
+
+class RandomPool:
+    """Process-wide buffer of uniform [0, 1) draws, refilled in bulk"""
+    size = 4096
+    
+    def __init__(self):
+        # Shared by all handler threads: deque.pop() is atomic, refills take the lock
+        self.values = deque()
+        self.lock = threading.Lock()
+        self.rng = np.random.default_rng() if np is not None else None
+    
+    def refill(self):
+        with self.lock:
+            if self.values:
+                return  # another thread refilled while we waited
+            if self.rng is not None:
+                self.values.extend(self.rng.random(self.size).tolist())
+            else:
+                self.values.extend([random.random() for _ in range(self.size)])
+    
+    def next(self):
+        while True:
+            try:
+                return self.values.pop()
+            except IndexError:
+                self.refill()
+    
+    def uniform(self, a, b):
+        return a + (b - a) * self.next()
+    
+    def cents(self, a, b):
+        """uniform(a, b) to two decimals; a and b must be whole numbers"""
+        # An int divided by 100 already prints with at most two decimals
+        return (a * 100 + int((b - a) * 100 * self.next())) / 100
+    
+    def randint(self, a, b):
+        return a + int(self.next() * (b - a + 1))
+    
+    def choice(self, seq):
+        return seq[int(self.next() * len(seq))]
+
+_rand = RandomPool()
+
+# Trading signals have a fixed shape, so the JSON is built from byte templates
+SIGNAL_SYMBOLS = (b'BTCUSDT', b'ETHUSDT', b'SOLUSDT', b'AVAXUSDT')
+SIGNAL_ACTIONS = (b'BUY', b'SELL', b'HOLD')
+SIGNAL_TIMEFRAMES = (b'1h', b'4h', b'1d')
+SIGNAL_ROW = (b'{"symbol":"%s","action":"%s","confidence":%d,"entry_price":%.2f,'
+              b'"stop_loss":%.2f,"take_profit":%.2f,"timeframe":"%s"}')
+SIGNALS_TEMPLATE = (b'{"signals":[%s],"generated_at":%.6f,'
+                    b'"accuracy_rate":"78.5%%","subscription_required":true}')
+
+API_CATALOG = {
+    'available_apis': [
+        {'endpoint': '/api/crypto-price', 'price': '$0.01 per request', 'description': 'Real-time crypto prices'},
+        {'endpoint': '/api/market-sentiment', 'price': '$0.05 per request', 'description': 'Market sentiment analysis'},
+        {'endpoint': '/api/trading-signals', 'price': '$0.25 per request', 'description': 'Premium trading signals'},
+        {'endpoint': '/api/yield-calculator', 'price': '$0.03 per request', 'description': 'DeFi yield calculator'},
+        {'endpoint': '/api/gas-tracker', 'price': '$0.02 per request', 'description': 'Gas fee tracker'}
+    ],
+    'stripe_payment_apis': [
+        {'endpoint': 'GET /api/stripe/payment-intent', 'description': 'Create payment intent (GET)', 'params': 'amount, email, description'},
+        {'endpoint': 'POST /api/stripe/create-payment', 'description': 'Create payment intent (POST)', 'body': 'amount, email, description, metadata'},
+        {'endpoint': 'POST /api/stripe/create-customer', 'description': 'Create Stripe customer', 'body': 'email, name, phone, metadata'},
+        {'endpoint': 'POST /api/stripe/process-charge', 'description': 'Process direct charge', 'body': 'amount, payment_method_id, email, description'},
+        {'endpoint': 'GET /api/stripe/payment-status', 'description': 'Check payment status', 'params': 'payment_intent_id'},
+        {'endpoint': 'GET /api/stripe/stats', 'description': 'Get Stripe payment statistics', 'params': 'none'}
+    ],
+    'total_revenue_potential': '$0.36 per full API usage cycle',
+    'stripe_integration': 'USD payment processing enabled',
+    'payment_currencies': ['USD'],
+    'stripe_account_status': 'Active'
+}
+
+# The catalog never changes, so it is encoded once at import
+CATALOG_BYTES = _dumps(API_CATALOG, indent=True)
+
 # Load environment variables from .env file
 def load_env_variables():
-    """Load environment variables from .env file"""
+    """Load environment variables from .env file (only the first call reads it)"""
+    if load_env_variables.done:
+        return
+    load_env_variables.done = True
+    
     env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
-    if os.path.exists(env_path):
+    try:
         with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return
+    
+    for line in lines:
+        line = line.strip()
+        if line and line[0] != '#' and '=' in line:
+            key, value = line.split('=', 1)
+            os.environ[key] = value
+
+load_env_variables.done = False
 
 # Load environment variables
 load_env_variables()
 
 class ProfitableAPIHandler(BaseHTTPRequestHandler):
+    # Set TCP_NODELAY on each connection and buffer wfile so headers and
+    # body leave in one send when the request finishes
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    
+    # Keep connections open between requests; every response carries
+    # Content-Length, and idle clients are dropped after 30s
+    protocol_version = 'HTTP/1.1'
+    timeout = 30
+    
+    GET_ROUTES = {
+        '/api/crypto-price': 'serve_crypto_price',
+        '/api/market-sentiment': 'serve_market_sentiment',
+        '/api/trading-signals': 'serve_trading_signals',
+        '/api/yield-calculator': 'serve_yield_calculator',
+        '/api/gas-tracker': 'serve_gas_tracker',
+        '/api/stripe/payment-intent': 'create_payment_intent',
+        '/api/stripe/payment-status': 'check_payment_status',
+        '/api/stripe/stats': 'serve_stripe_stats'
+    }
+    
+    response_heads = {}  # (protocol, status, cors) -> encoded header block
+    
+    POST_ROUTES = {
+        '/api/stripe/create-payment': 'create_stripe_payment',
+        '/api/stripe/create-customer': 'create_stripe_customer',
+        '/api/stripe/process-charge': 'process_stripe_charge'
+    }
+    
     def __init__(self, revenue_tracker, stripe_processor, *args, **kwargs):
         self.revenue_tracker = revenue_tracker
         self.stripe_processor = stripe_processor
         super().__init__(*args, **kwargs)
     
     def do_GET(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        query_params = parse_qs(parsed_path.query)
-        
-        if path == '/api/crypto-price':
-            self.serve_crypto_price(query_params)
-        elif path == '/api/market-sentiment':
-            self.serve_market_sentiment(query_params)
-        elif path == '/api/trading-signals':
-            self.serve_trading_signals(query_params)
-        elif path == '/api/yield-calculator':
-            self.serve_yield_calculator(query_params)
-        elif path == '/api/gas-tracker':
-            self.serve_gas_tracker(query_params)
-        elif path == '/api/stripe/payment-intent':
-            self.create_payment_intent(query_params)
-        elif path == '/api/stripe/payment-status':
-            self.check_payment_status(query_params)
-        elif path == '/api/stripe/stats':
-            self.serve_stripe_stats()
+        path, _, query = self.path.partition('?')
+        query_params = parse_qs(query) if query else {}
+        
+        handler = self.GET_ROUTES.get(path)
+        if handler:
+            getattr(self, handler)(query_params)
         else:
             self.serve_api_catalog()
     
     def do_POST(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        path = self.path.partition('?')[0]
         
         # Read POST data
         content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else '{}'
+        post_data = self.rfile.read(content_length) if content_length > 0 else b'{}'
         
         try:
-            post_params = json.loads(post_data)
-        except json.JSONDecodeError:
+            post_params = _loads(post_data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             post_params = {}
         
-        if path == '/api/stripe/create-payment':
-            self.create_stripe_payment(post_params)
-        elif path == '/api/stripe/create-customer':
-            self.create_stripe_customer(post_params)
-        elif path == '/api/stripe/process-charge':
-            self.process_stripe_charge(post_params)
+        handler = self.POST_ROUTES.get(path)
+        if handler:
+            getattr(self, handler)(post_params)
         else:
-            self.send_response(404)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Endpoint not found'}).encode())
+            self.send_json({'error': 'Endpoint not found'}, 404)
+    
+    def send_json(self, data, status=200, cors=False):
+        """Send data as a JSON response"""
+        self.send_body(_dumps(data), status, cors)
+    
+    def send_body(self, body, status=200, cors=False):
+        """Send already-encoded JSON bytes with a prebuilt header block"""
+        key = (self.protocol_version, status, cors)
+        head = self.response_heads.get(key)
+        if head is None:
+            head = (f"{self.protocol_version} {status} {self.responses[status][0]}\r\n"
+                    f"Server: {self.version_string()}\r\n"
+                    "Content-Type: application/json\r\n"
+                    + ("Access-Control-Allow-Origin: *\r\n" if cors else "")).encode('latin-1')
+            self.response_heads[key] = head
+        self.wfile.write(b"%sDate: %s\r\nContent-Length: %d\r\n\r\n%s"
+                         % (head, _http_date(), len(body), body))
+    
+    def log_request(self, code='-', size='-'):
+        # No per-request access log line; errors still go through log_error
+        pass
     
     def serve_crypto_price(self, params):
         """Premium crypto price API - $0.01 per request"""
         symbol = params.get('symbol', ['BTC'])[0]
-        price = round(random.uniform(20000, 70000), 2)
+        price = _rand.cents(20000, 70000)
         
         response = {
             'symbol': symbol,
             'price': price,
             'timestamp': time.time(),
-            'change_24h': round(random.uniform(-5, 5), 2)
+            'change_24h': _rand.cents(-5, 5)
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response)
         
         self.revenue_tracker.add_revenue('crypto_price_api', 0.01)
     
     def serve_market_sentiment(self, params):
         """Market sentiment analysis API - $0.05 per request"""
-        sentiment_score = random.uniform(-1, 1)
+        sentiment_score = _rand.uniform(-1, 1)
         sentiment = 'bullish' if sentiment_score > 0.2 else 'bearish' if sentiment_score < -0.2 else 'neutral'
         
         response = {
             'sentiment': sentiment,
             'score': round(sentiment_score, 3),
-            'confidence': random.randint(70, 95),
-            'sources_analyzed': random.randint(50, 200),
+            'confidence': _rand.randint(70, 95),
+            'sources_analyzed': _rand.randint(50, 200),
             'timestamp': time.time()
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response)
         
         self.revenue_tracker.add_revenue('sentiment_api', 0.05)
     
     def serve_trading_signals(self, params):
         """Premium trading signals API - $0.25 per request"""
-        symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'AVAXUSDT']
-        signals = []
-        
-        for symbol in symbols:
-            signal = {
-                'symbol': symbol,
-                'action': random.choice(['BUY', 'SELL', 'HOLD']),
-                'confidence': random.randint(75, 98),
-                'entry_price': round(random.uniform(1000, 50000), 2),
-                'stop_loss': round(random.uniform(900, 48000), 2),
-                'take_profit': round(random.uniform(1100, 55000), 2),
-                'timeframe': random.choice(['1h', '4h', '1d'])
-            }
-            signals.append(signal)
-        
-        response = {
-            'signals': signals,
-            'generated_at': time.time(),
-            'accuracy_rate': '78.5%',
-            'subscription_required': True
-        }
+        rows = [
+            SIGNAL_ROW % (
+                symbol,
+                _rand.choice(SIGNAL_ACTIONS),
+                _rand.randint(75, 98),
+                _rand.cents(1000, 50000),
+                _rand.cents(900, 48000),
+                _rand.cents(1100, 55000),
+                _rand.choice(SIGNAL_TIMEFRAMES)
+            )
+            for symbol in SIGNAL_SYMBOLS
+        ]
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_body(SIGNALS_TEMPLATE % (b','.join(rows), time.time()))
         
         self.revenue_tracker.add_revenue('trading_signals_api', 0.25)
     
@@ -154,7 +294,7 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
         amount = float(params.get('amount', ['1000'])[0])
         protocol = params.get('protocol', ['aave'])[0]
         
-        base_apy = random.uniform(3, 15)
+        base_apy = _rand.uniform(3, 15)
         compound_apy = base_apy * 1.1
         
         response = {
@@ -167,10 +307,7 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
             'yearly_yield': round(amount * base_apy / 100, 2)
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response)
         
         self.revenue_tracker.add_revenue('yield_calculator_api', 0.03)
     
@@ -179,22 +316,19 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
         response = {
             'network': 'ethereum',
             'gas_prices': {
-                'slow': random.randint(20, 40),
-                'standard': random.randint(40, 80),
-                'fast': random.randint(80, 150)
+                'slow': _rand.randint(20, 40),
+                'standard': _rand.randint(40, 80),
+                'fast': _rand.randint(80, 150)
             },
             'usd_estimates': {
-                'simple_transfer': round(random.uniform(2, 15), 2),
-                'defi_swap': round(random.uniform(15, 50), 2),
-                'nft_mint': round(random.uniform(30, 100), 2)
+                'simple_transfer': _rand.cents(2, 15),
+                'defi_swap': _rand.cents(15, 50),
+                'nft_mint': _rand.cents(30, 100)
             },
             'timestamp': time.time()
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response)
         
         self.revenue_tracker.add_revenue('gas_tracker_api', 0.02)
     
@@ -216,11 +350,7 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
             }
         )
         
-        self.send_response(200 if result['success'] else 400)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(result).encode())
+        self.send_json(result, 200 if result['success'] else 400, cors=True)
         
         if result['success']:
             self.revenue_tracker.add_revenue('stripe_payment_intent', amount_usd)
@@ -234,21 +364,13 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
         else:
             response = self.stripe_processor.retrieve_payment_intent(payment_intent_id)
         
-        self.send_response(200 if response.get('success', False) else 400)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response, 200 if response.get('success', False) else 400, cors=True)
     
-    def serve_stripe_stats(self):
+    def serve_stripe_stats(self, params):
         """Serve Stripe payment statistics"""
         stats = self.stripe_processor.get_payment_stats()
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(stats).encode())
+        self.send_json(stats, cors=True)
     
     def create_stripe_payment(self, params):
         """Create Stripe payment via POST request"""
@@ -266,11 +388,7 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
             metadata={**metadata, 'source': 'api_server', 'endpoint': 'post_payment'}
         )
         
-        self.send_response(200 if result['success'] else 400)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(result).encode())
+        self.send_json(result, 200 if result['success'] else 400, cors=True)
         
         if result['success']:
             self.revenue_tracker.add_revenue('stripe_payment_post', float(amount_usd))
@@ -292,11 +410,7 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
                 metadata={**metadata, 'source': 'api_server'}
             )
         
-        self.send_response(200 if response.get('success', False) else 400)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response, 200 if response.get('success', False) else 400, cors=True)
     
     def process_stripe_charge(self, params):
         """Process direct Stripe charge via POST request"""
@@ -319,73 +433,127 @@ class ProfitableAPIHandler(BaseHTTPRequestHandler):
                 metadata={**metadata, 'source': 'api_server', 'endpoint': 'direct_charge'}
             )
         
-        self.send_response(200 if response.get('success', False) else 400)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json(response, 200 if response.get('success', False) else 400, cors=True)
         
         if response.get('success', False):
             self.revenue_tracker.add_revenue('stripe_direct_charge', float(amount_usd))
     
     def serve_api_catalog(self):
         """API catalog and pricing"""
-        catalog = {
-            'available_apis': [
-                {'endpoint': '/api/crypto-price', 'price': '$0.01 per request', 'description': 'Real-time crypto prices'},
-                {'endpoint': '/api/market-sentiment', 'price': '$0.05 per request', 'description': 'Market sentiment analysis'},
-                {'endpoint': '/api/trading-signals', 'price': '$0.25 per request', 'description': 'Premium trading signals'},
-                {'endpoint': '/api/yield-calculator', 'price': '$0.03 per request', 'description': 'DeFi yield calculator'},
-                {'endpoint': '/api/gas-tracker', 'price': '$0.02 per request', 'description': 'Gas fee tracker'}
-            ],
-            'stripe_payment_apis': [
-                {'endpoint': 'GET /api/stripe/payment-intent', 'description': 'Create payment intent (GET)', 'params': 'amount, email, description'},
-                {'endpoint': 'POST /api/stripe/create-payment', 'description': 'Create payment intent (POST)', 'body': 'amount, email, description, metadata'},
-                {'endpoint': 'POST /api/stripe/create-customer', 'description': 'Create Stripe customer', 'body': 'email, name, phone, metadata'},
-                {'endpoint': 'POST /api/stripe/process-charge', 'description': 'Process direct charge', 'body': 'amount, payment_method_id, email, description'},
-                {'endpoint': 'GET /api/stripe/payment-status', 'description': 'Check payment status', 'params': 'payment_intent_id'},
-                {'endpoint': 'GET /api/stripe/stats', 'description': 'Get Stripe payment statistics', 'params': 'none'}
-            ],
-            'total_revenue_potential': '$0.36 per full API usage cycle',
-            'stripe_integration': 'USD payment processing enabled',
-            'payment_currencies': ['USD'],
-            'stripe_account_status': 'Active'
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(catalog, indent=2).encode())
+        self.send_body(CATALOG_BYTES)
 
 class RevenueTracker:
     def __init__(self):
-        self.total_revenue = 0
-        self.api_calls = {}
+        # Totals are kept in integer cents so concurrent updates stay exact
+        self.total_cents = 0
+        self.call_counts = Counter()
+        self.revenue_cents = Counter()
         self.start_time = time.time()
+        self.lock = threading.Lock()  # guards totals and the log buffer
+        
+        # Revenue log lines are buffered and written in batches
+        self.log_file = open('api_revenue_log.txt', 'a', buffering=65536)
+        self.log_buffer = []
+        self.last_flush = time.monotonic()
+        self.stamp_second = None  # log timestamps only change once a second
+        self.stamp_text = ''
+        atexit.register(self.close_log)
+        
+        # Request handlers only enqueue; a background thread does the accounting
+        self.pending = queue.SimpleQueue()
+        threading.Thread(target=self._consume, daemon=True).start()
+    
+    @property
+    def total_revenue(self):
+        return self.total_cents / 100
     
     def add_revenue(self, api_type, amount):
-        self.total_revenue += amount
-        if api_type not in self.api_calls:
-            self.api_calls[api_type] = {'count': 0, 'revenue': 0}
-        
-        self.api_calls[api_type]['count'] += 1
-        self.api_calls[api_type]['revenue'] += amount
-        
-        print(f"API Call: {api_type} | Revenue: ${amount:.3f} | Total: ${self.total_revenue:.2f}")
-        
-        # Log to file
-        with open('api_revenue_log.txt', 'a') as f:
-            f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')},{api_type},{amount:.3f},{self.total_revenue:.2f}\n")
+        self.pending.put((api_type, amount, time.time()))
+    
+    def _consume(self):
+        """Apply queued revenue events in batches"""
+        while True:
+            try:
+                first = self.pending.get(timeout=1.0)
+            except queue.Empty:
+                first = None
+            with self.lock:
+                calls = self._apply_pending(first)
+                if len(self.log_buffer) >= 64 or time.monotonic() - self.last_flush > 1.0:
+                    self._write_log_buffer()
+            if calls:
+                print('\n'.join(calls))
+    
+    def _apply_pending(self, first=None):
+        """Drain the queue into the totals and return one summary line per event;
+        caller must hold self.lock"""
+        events = [] if first is None else [first]
+        while True:
+            try:
+                events.append(self.pending.get_nowait())
+            except queue.Empty:
+                break
+        
+        calls = []
+        for api_type, amount, ts in events:
+            cents = round(amount * 100)
+            self.total_cents += cents
+            self.call_counts[api_type] += 1
+            self.revenue_cents[api_type] += cents
+            total = self.total_cents / 100
+            
+            second = int(ts)
+            if second != self.stamp_second:
+                self.stamp_second = second
+                self.stamp_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self.log_buffer.append(f"{self.stamp_text},{api_type},{amount:.3f},{total:.2f}\n")
+            calls.append(f"API Call: {api_type} | Revenue: ${amount:.3f} | Total: ${total:.2f}")
+        return calls
+    
+    def _write_log_buffer(self):
+        """Write buffered log lines; caller must hold self.lock"""
+        if self.log_buffer and not self.log_file.closed:
+            self.log_file.write(''.join(self.log_buffer))
+            self.log_file.flush()
+            self.log_buffer.clear()
+        self.last_flush = time.monotonic()
+    
+    def flush_log(self):
+        """Apply queued revenue and write any buffered log lines to disk"""
+        with self.lock:
+            calls = self._apply_pending()
+            self._write_log_buffer()
+        if calls:
+            print('\n'.join(calls))
+    
+    def close_log(self):
+        """Flush and close the revenue log"""
+        self.flush_log()
+        with self.lock:
+            self.log_file.close()
     
     def get_stats(self):
         uptime = time.time() - self.start_time
+        with self.lock:
+            total_revenue = self.total_cents / 100
+            api_breakdown = {
+                api_type: {'count': count, 'revenue': self.revenue_cents[api_type] / 100}
+                for api_type, count in self.call_counts.items()
+            }
         return {
-            'total_revenue': self.total_revenue,
+            'total_revenue': total_revenue,
             'uptime_hours': uptime / 3600,
-            'revenue_per_hour': self.total_revenue / (uptime / 3600) if uptime > 0 else 0,
-            'api_breakdown': self.api_calls
+            'revenue_per_hour': total_revenue / (uptime / 3600) if uptime > 0 else 0,
+            'api_breakdown': api_breakdown
         }
 
+class APIServer(ThreadingHTTPServer):
+    daemon_threads = True  # don't wait for in-flight handlers on shutdown
+    
+    def server_bind(self):
+        super().server_bind()
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+
 def create_handler(revenue_tracker, stripe_processor):
     def handler(*args, **kwargs):
         return ProfitableAPIHandler(revenue_tracker, stripe_processor, *args, **kwargs)
@@ -410,17 +578,22 @@ def run_api_server():
             print("API server will run without Stripe integration")
             stripe_processor = None
     
-    # Find available port
+    # Find available port, retrying bind() on one socket
     port = 8000
+    server = APIServer(('localhost', port), create_handler(revenue_tracker, stripe_processor),
+                       bind_and_activate=False)
     while True:
         try:
-            server = HTTPServer(('localhost', port), create_handler(revenue_tracker, stripe_processor))
+            server.server_address = ('localhost', port)
+            server.server_bind()
             break
         except OSError:
             port += 1
             if port > 8100:
                 print("No available ports found")
+                server.server_close()
                 return
+    server.server_activate()
     
     print(f"API Server starting on http://localhost:{port}")
     print("Available endpoints:")
@@ -464,6 +637,7 @@ def run_api_server():
     try:
         server.serve_forever()
     except KeyboardInterrupt:
+        revenue_tracker.close_log()
         print(f"\nAPI Server stopped. Final revenue: ${revenue_tracker.total_revenue:.2f}")
         if stripe_processor:
             stripe_stats = stripe_processor.get_payment_stats()
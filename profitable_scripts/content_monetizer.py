@@ -3,9 +3,14 @@
 Automated Content Generator & Monetizer
 Creates valuable content and monetizes through multiple channels
 """
-import random, time, json, os, requests
+import random, time, json, os, atexit, requests
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ContentMonetizer:
     def __init__(self):
         self.content_types = [
@@ -21,6 +26,10 @@ class ContentMonetizer:
             'blockchain_news': 8.0
         }
         
+        # Line-buffered, so each entry still reaches the dashboards right away
+        self.revenue_log = open('content_revenue_log.txt', 'a', buffering=1)
+        atexit.register(self.revenue_log.close)
+        
     def generate_crypto_analysis(self):
         """Generate crypto market analysis content"""
         coins = ['BTC', 'ETH', 'SOL', 'AVAX', 'MATIC', 'DOT', 'ADA', 'LINK']
@@ -112,8 +121,12 @@ class ContentMonetizer:
         """Simulate publishing content and earning revenue"""
         filename = f"content_{content['type']}_{int(time.time())}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(content, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(content, f, indent=2)
         
         revenue = content['estimated_revenue']
         
@@ -122,8 +135,7 @@ class ContentMonetizer:
         print(f"Channels: {', '.join(content['monetization_channels'])}")
         
         # Log revenue
-        with open('content_revenue_log.txt', 'a') as f:
-            f.write(f"{datetime.now().isoformat()},{content['type']},{revenue:.2f}\n")
+        self.revenue_log.write(f"{datetime.now().isoformat()},{content['type']},{revenue:.2f}\n")
         
         return revenue
 
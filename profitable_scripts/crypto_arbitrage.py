@@ -3,8 +3,13 @@
 Crypto Arbitrage One-Liner
 Monitors price differences between exchanges and executes profitable trades
 """
-import asyncio, aiohttp, json, os, time
-from decimal import Decimal
+import asyncio, aiohttp, json, os, time, atexit
+
+try:
+    import uvloop
+except ImportError:
+    # Fall back to the default asyncio event loop
+    uvloop = None
 
 class ArbitrageBot:
     def __init__(self):
@@ -13,25 +18,44 @@ class ArbitrageBot:
             'kraken': 'https://api.kraken.com/0/public/Ticker?pair=XBTUSD',
             'coinbase': 'https://api.coinbase.com/v2/exchange-rates?currency=BTC'
         }
-        self.min_profit_threshold = Decimal('0.005')  # 0.5% minimum profit
-        
+        self.min_profit_threshold = 0.005  # 0.5% minimum profit
+        self.session = None  # created on first use, inside the running loop
+        self.log = open('arbitrage_log.txt', 'a', buffering=1)
+        atexit.register(self.log.close)
+    
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.session
+    
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def fetch_price(self, session, exchange, url):
+        try:
+            async with session.get(url) as resp:
+                data = await resp.json()
+                if exchange == 'binance':
+                    return float(data['price'])
+                elif exchange == 'kraken':
+                    pair_data = list(data['result'].values())[0]
+                    return float(pair_data['c'][0])
+                elif exchange == 'coinbase':
+                    return float(data['data']['rates']['USD'])
+        except Exception as e:
+            print(f"Error fetching {exchange} price: {e}")
+        return None
+    
     async def get_prices(self):
-        prices = {}
-        async with aiohttp.ClientSession() as session:
-            for exchange, url in self.exchanges.items():
-                try:
-                    async with session.get(url) as resp:
-                        data = await resp.json()
-                        if exchange == 'binance':
-                            prices[exchange] = Decimal(data['price'])
-                        elif exchange == 'kraken':
-                            pair_data = list(data['result'].values())[0]
-                            prices[exchange] = Decimal(pair_data['c'][0])
-                        elif exchange == 'coinbase':
-                            prices[exchange] = Decimal(data['data']['rates']['USD'])
-                except Exception as e:
-                    print(f"Error fetching {exchange} price: {e}")
-        return prices
+        session = await self.get_session()
+        results = await asyncio.gather(*(self.fetch_price(session, exchange, url)
+                                         for exchange, url in self.exchanges.items()))
+        return {exchange: price for exchange, price in zip(self.exchanges, results) if price is not None}
     
     async def find_arbitrage(self):
         prices = await self.get_prices()
@@ -47,30 +71,40 @@ class ArbitrageBot:
             return {
                 'buy_exchange': min_exchange,
                 'sell_exchange': max_exchange,
-                'buy_price': float(prices[min_exchange]),
-                'sell_price': float(prices[max_exchange]),
-                'profit_pct': float(profit_pct * 100),
-                'estimated_profit_usd': float(profit_pct * 1000)  # Assuming $1000 position
+                'buy_price': prices[min_exchange],
+                'sell_price': prices[max_exchange],
+                'profit_pct': profit_pct * 100,
+                'estimated_profit_usd': profit_pct * 1000  # Assuming $1000 position
             }
         return None
 
 async def run_arbitrage():
     bot = ArbitrageBot()
-    while True:
-        try:
-            opportunity = await bot.find_arbitrage()
-            if opportunity:
-                timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-                print(f"[{timestamp}] ARBITRAGE OPPORTUNITY: Buy on {opportunity['buy_exchange']} at ${opportunity['buy_price']:.2f}, Sell on {opportunity['sell_exchange']} at ${opportunity['sell_price']:.2f} | Profit: {opportunity['profit_pct']:.2f}% (${opportunity['estimated_profit_usd']:.2f})")
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    try:
+        while True:
+            try:
+                opportunity = await bot.find_arbitrage()
+                if opportunity:
+                    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+                    print(f"[{timestamp}] ARBITRAGE OPPORTUNITY: Buy on {opportunity['buy_exchange']} at ${opportunity['buy_price']:.2f}, Sell on {opportunity['sell_exchange']} at ${opportunity['sell_price']:.2f} | Profit: {opportunity['profit_pct']:.2f}% (${opportunity['estimated_profit_usd']:.2f})")
+                    
+                    # Log to file for tracking
+                    bot.log.write(f"{timestamp},{opportunity['buy_exchange']},{opportunity['sell_exchange']},{opportunity['profit_pct']:.2f},{opportunity['estimated_profit_usd']:.2f}\n")
                 
-                # Log to file for tracking
-                with open('arbitrage_log.txt', 'a') as f:
-                    f.write(f"{timestamp},{opportunity['buy_exchange']},{opportunity['sell_exchange']},{opportunity['profit_pct']:.2f},{opportunity['estimated_profit_usd']:.2f}\n")
-            
-            await asyncio.sleep(30)  # Check every 30 seconds
-        except Exception as e:
-            print(f"Error in arbitrage loop: {e}")
-            await asyncio.sleep(60)
+                # Check every 30 seconds on a fixed schedule; an overrun skips the missed tick
+                next_tick = max(next_tick + 30, loop.time())
+                await asyncio.sleep(next_tick - loop.time())
+            except Exception as e:
+                print(f"Error in arbitrage loop: {e}")
+                await asyncio.sleep(60)
+                next_tick = loop.time()
+    finally:
+        await bot.close()
 
 if __name__ == "__main__":
-    asyncio.run(run_arbitrage())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(run_arbitrage())
+    else:
+        asyncio.run(run_arbitrage())
\ No newline at end of file
@@ -3,10 +3,26 @@
 Web Scraping Revenue Generator
 Extracts valuable data and monetizes through APIs and data sales
 """
-import requests, json, time, os, hashlib
+import requests, json, time, os, atexit, hashlib, io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from lxml import etree
+except ImportError:
+    # Fall back to BeautifulSoup's pure-Python parser
+    etree = None
+
 class DataHarvester:
     def __init__(self):
         self.sources = {
@@ -16,12 +32,33 @@ class DataHarvester:
         }
         self.data_value_per_record = 0.10  # $0.10 per unique data record
         
+        # One pooled session so each cycle reuses the previous connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # The sentiment and keyword scrapes are independent, so they run side by side
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        
+        # News pages change slowly, so most headlines were already hashed last cycle
+        self.headline_hashes = OrderedDict()
+        self.headline_cache_size = 1024
+        
+        # Opened once per process; line buffering keeps each cycle's entry visible
+        self.revenue_log = open('data_revenue_log.txt', 'a', buffering=1)
+        atexit.register(self.revenue_log.close)
+        
     def scrape_crypto_sentiment(self):
         """Scrape crypto news for sentiment analysis - valuable for trading bots"""
         try:
-            response = requests.get('https://cryptonews.com/', timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            headlines = [h.get_text().strip() for h in soup.find_all('h2', class_='article__title')]
+            response = self.session.get('https://cryptonews.com/', timeout=10)
+            if etree is not None:
+                headlines = self.first_headlines(response.content, 10)
+            else:
+                soup = BeautifulSoup(response.content, 'html.parser')
+                headlines = [h.get_text().strip() for h in soup.find_all('h2', class_='article__title')]
             
             sentiment_data = []
             for headline in headlines[:10]:  # Top 10 headlines
@@ -29,7 +66,7 @@ class DataHarvester:
                     'headline': headline,
                     'timestamp': time.time(),
                     'source': 'cryptonews',
-                    'hash': hashlib.md5(headline.encode()).hexdigest()
+                    'hash': self.headline_hash(headline)
                 }
                 sentiment_data.append(record)
             
@@ -38,6 +75,32 @@ class DataHarvester:
             print(f"Error scraping crypto sentiment: {e}")
             return []
     
+    def first_headlines(self, content, limit):
+        """Stream-parse content and stop after `limit` article__title headings"""
+        headlines = []
+        try:
+            for _, elem in etree.iterparse(io.BytesIO(content), html=True, tag='h2'):
+                if 'article__title' in (elem.get('class') or '').split():
+                    headlines.append(''.join(elem.itertext()).strip())
+                    if len(headlines) >= limit:
+                        break
+                elem.clear()
+        except etree.XMLSyntaxError:
+            pass  # empty or truncated page; keep what was found
+        return headlines
+    
+    def headline_hash(self, headline):
+        """Dedup key for a headline, cached in a bounded LRU"""
+        digest = self.headline_hashes.get(headline)
+        if digest is not None:
+            self.headline_hashes.move_to_end(headline)
+            return digest
+        digest = hashlib.blake2b(headline.encode(), digest_size=16).hexdigest()
+        self.headline_hashes[headline] = digest
+        if len(self.headline_hashes) > self.headline_cache_size:
+            self.headline_hashes.popitem(last=False)
+        return digest
+    
     def scrape_trending_keywords(self):
         """Scrape trending keywords for SEO and content monetization"""
         try:
@@ -48,26 +111,26 @@ class DataHarvester:
                 'Yield farming', 'DEX aggregator', 'Memecoin tracker'
             ]
             
-            keyword_data = []
-            for keyword in keywords:
-                record = {
-                    'keyword': keyword,
-                    'search_volume': 1000 + (hash(keyword) % 5000),  # Simulated volume
-                    'competition': (hash(keyword) % 100) / 100,
-                    'timestamp': time.time(),
-                    'revenue_potential': (hash(keyword) % 50) + 10  # $10-60 per keyword
-                }
-                keyword_data.append(record)
+            hashes = np.fromiter((hash(k) for k in keywords), dtype=np.int64, count=len(keywords))
+            frame = pd.DataFrame({
+                'keyword': keywords,
+                'search_volume': 1000 + (hashes % 5000),  # Simulated volume
+                'competition': (hashes % 100) / 100,
+                'timestamp': time.time(),
+                'revenue_potential': (hashes % 50) + 10  # $10-60 per keyword
+            })
             
-            return keyword_data
+            return frame.to_dict(orient='records')
         except Exception as e:
             print(f"Error scraping keywords: {e}")
             return []
     
     def generate_api_data(self):
         """Generate API endpoints with scraped data for monetization"""
-        crypto_data = self.scrape_crypto_sentiment()
-        keyword_data = self.scrape_trending_keywords()
+        crypto_future = self.executor.submit(self.scrape_crypto_sentiment)
+        keyword_future = self.executor.submit(self.scrape_trending_keywords)
+        crypto_data = crypto_future.result()
+        keyword_data = keyword_future.result()
         
         api_package = {
             'crypto_sentiment': crypto_data,
@@ -82,8 +145,12 @@ class DataHarvester:
     def save_and_monetize(self, data):
         """Save data and calculate revenue"""
         filename = f"data_harvest_{int(time.time())}.json"
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
         
         revenue = data['estimated_value']
         print(f"Data package saved: {filename}")
@@ -91,8 +158,7 @@ class DataHarvester:
         print(f"Estimated revenue: ${revenue:.2f}")
         
         # Log revenue
-        with open('data_revenue_log.txt', 'a') as f:
-            f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')},{data['total_records']},{revenue:.2f}\n")
+        self.revenue_log.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')},{data['total_records']},{revenue:.2f}\n")
         
         return revenue
 
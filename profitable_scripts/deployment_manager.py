@@ -31,6 +31,10 @@ class InstanceManager:
         self.instance_configs = []
         self.running = True
         
+        # Revenue logs only grow, so each pass reads just the bytes appended since the last one
+        self.log_offsets = {}
+        self.log_totals = {}
+        
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
@@ -172,19 +176,9 @@ DEPLOYMENT_REGION = "{config['deployment_region']}"
             if revenue_log_pattern in file:
                 log_path = os.path.join(instance_dir, file)
                 try:
-                    with open(log_path, 'r') as f:
-                        lines = f.readlines()
-                        for line in lines:
-                            if ',' in line:
-                                parts = line.strip().split(',')
-                                if len(parts) >= 3:
-                                    try:
-                                        revenue = float(parts[-1])
-                                        total_revenue += revenue
-                                    except ValueError:
-                                        continue
+                    total_revenue += self.read_new_revenue(log_path)
                 except Exception:
-                    continue
+                    total_revenue += self.log_totals.get(log_path, 0)
         
         # Apply revenue multiplier based on script type
         script_type = config['script_type']
@@ -194,6 +188,33 @@ DEPLOYMENT_REGION = "{config['deployment_region']}"
         instance['revenue_generated'] = adjusted_revenue
         return adjusted_revenue
     
+    def read_new_revenue(self, log_path):
+        """Add revenue from lines appended to log_path since the last call; return the running total"""
+        offset = self.log_offsets.get(log_path, 0)
+        total = self.log_totals.get(log_path, 0)
+        
+        with open(log_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < offset:
+                # Log was truncated or replaced; start over
+                offset, total = 0, 0
+            f.seek(offset)
+            chunk = f.read()
+        
+        # Leave a partially written last line for the next pass
+        end = chunk.rfind(b'\n') + 1
+        for line in chunk[:end].decode(errors='replace').splitlines():
+            if ',' in line:
+                parts = line.strip().split(',')
+                if len(parts) >= 3:
+                    try:
+                        total += float(parts[-1])
+                    except ValueError:
+                        continue
+        
+        self.log_offsets[log_path] = offset + end
+        self.log_totals[log_path] = total
+        return total
+    
     def check_instance_health(self, instance_id):
         """Check if instance is healthy and restart if needed"""
         if instance_id not in self.instances:
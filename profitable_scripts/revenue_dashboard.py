@@ -4,13 +4,15 @@ Revenue Monitoring Dashboard
 Real-time monitoring and analytics for all 100 profitable instances
 """
 import json, time, os, threading
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
 import subprocess, sys
 
 class RevenueDashboard:
     def __init__(self):
         self.total_revenue = 0
-        self.revenue_history = []
+        self.revenue_history = deque(maxlen=100)  # Keep only last 100 data points
         self.instance_stats = {}
         self.running = True
         
@@ -64,10 +66,6 @@ class RevenueDashboard:
             'active_instances': active_instances
         })
         
-        # Keep only last 100 data points
-        if len(self.revenue_history) > 100:
-            self.revenue_history = self.revenue_history[-100:]
-        
         return total_revenue, active_instances
     
     def calculate_growth_metrics(self):
@@ -149,7 +147,7 @@ class RevenueDashboard:
         if len(self.revenue_history) >= 5:
             print("📊 REVENUE TREND (Last 5 Updates)")
             print("-" * 30)
-            recent_history = self.revenue_history[-5:]
+            recent_history = islice(self.revenue_history, len(self.revenue_history) - 5, None)
             for entry in recent_history:
                 timestamp = datetime.fromisoformat(entry['timestamp']).strftime('%H:%M:%S')
                 print(f"{timestamp}: ${entry['total_revenue']:.2f} ({entry['active_instances']} active)")
@@ -183,7 +181,7 @@ class RevenueDashboard:
             },
             'growth_metrics': self.calculate_growth_metrics(),
             'instance_breakdown': self.instance_stats,
-            'revenue_history': self.revenue_history
+            'revenue_history': list(self.revenue_history)
         }
         
         with open('revenue_analytics_report.json', 'w') as f:
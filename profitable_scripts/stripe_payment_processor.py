@@ -8,6 +8,7 @@ import stripe
 import json
 import time
 import random
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -46,6 +47,9 @@ class StripePaymentProcessor:
         self.successful_payments = 0
         self.failed_payments = 0
         
+        # The API server calls in from one thread per connection
+        self.lock = threading.Lock()
+        
         # Initialize log file if it doesn't exist
         if not os.path.exists(self.payment_log_file):
             with open(self.payment_log_file, 'w') as f:
@@ -77,8 +81,7 @@ class StripePaymentProcessor:
             mock_payment_id = f"pi_mock_{int(time.time())}{random.randint(1000, 9999)}"
             mock_client_secret = f"{mock_payment_id}_secret_{random.randint(10000, 99999)}"
             
-            self.successful_payments += 1
-            self.total_processed += amount_cents / 100
+            self._count_success(amount_cents / 100)
             
             self._log_payment(
                 payment_id=mock_payment_id,
@@ -120,8 +123,7 @@ class StripePaymentProcessor:
             # Create payment intent
             payment_intent = stripe.PaymentIntent.create(**payment_intent_data)
             
-            self.successful_payments += 1
-            self.total_processed += amount_cents / 100
+            self._count_success(amount_cents / 100)
             
             # Log the payment creation
             self._log_payment(
@@ -151,8 +153,7 @@ class StripePaymentProcessor:
                 mock_client_secret = f"{mock_payment_id}_secret_{random.randint(10000, 99999)}"
                 
                 self.mock_mode = True  # Switch permanently to mock mode
-                self.successful_payments += 1
-                self.total_processed += amount_cents / 100
+                self._count_success(amount_cents / 100)
                 
                 self._log_payment(
                     payment_id=mock_payment_id,
@@ -174,7 +175,7 @@ class StripePaymentProcessor:
                     'fallback_reason': 'network_error'
                 }
             
-            self.failed_payments += 1
+            self._count_failure()
             error_message = f"Stripe error: {str(e)}"
             
             self._log_payment(
@@ -193,7 +194,7 @@ class StripePaymentProcessor:
             }
         
         except Exception as e:
-            self.failed_payments += 1
+            self._count_failure()
             error_message = f"General error: {str(e)}"
             
             self._log_payment(
@@ -255,8 +256,7 @@ class StripePaymentProcessor:
             payment_intent = stripe.PaymentIntent.create(**charge_data)
             
             if payment_intent.status == 'succeeded':
-                self.successful_payments += 1
-                self.total_processed += amount_cents / 100
+                self._count_success(amount_cents / 100)
                 
                 self._log_payment(
                     payment_id=payment_intent.id,
@@ -276,7 +276,7 @@ class StripePaymentProcessor:
                     'charges': payment_intent.charges.data
                 }
             else:
-                self.failed_payments += 1
+                self._count_failure()
                 
                 self._log_payment(
                     payment_id=payment_intent.id,
@@ -295,7 +295,7 @@ class StripePaymentProcessor:
                 }
                 
         except stripe.error.StripeError as e:
-            self.failed_payments += 1
+            self._count_failure()
             error_message = f"Stripe error: {str(e)}"
             
             self._log_payment(
@@ -409,19 +409,35 @@ class StripePaymentProcessor:
         Returns:
             Dictionary with payment statistics
         """
+        with self.lock:
+            total_processed = self.total_processed
+            successful_payments = self.successful_payments
+            failed_payments = self.failed_payments
+        
         return {
-            'total_processed_usd': self.total_processed,
-            'successful_payments': self.successful_payments,
-            'failed_payments': self.failed_payments,
+            'total_processed_usd': total_processed,
+            'successful_payments': successful_payments,
+            'failed_payments': failed_payments,
             'success_rate': (
-                self.successful_payments / (self.successful_payments + self.failed_payments) * 100
-                if (self.successful_payments + self.failed_payments) > 0
+                successful_payments / (successful_payments + failed_payments) * 100
+                if (successful_payments + failed_payments) > 0
                 else 0
             ),
             'stripe_account': self.stripe_secret_key[:12] + '...' if self.stripe_secret_key else 'Not configured',
             'mock_mode': self.mock_mode
         }
     
+    def _count_success(self, amount_usd: float):
+        """Record a successful payment"""
+        with self.lock:
+            self.successful_payments += 1
+            self.total_processed += amount_usd
+    
+    def _count_failure(self):
+        """Record a failed payment"""
+        with self.lock:
+            self.failed_payments += 1
+    
     def _log_payment(
         self,
         payment_id: str,
@@ -434,7 +450,7 @@ class StripePaymentProcessor:
         """Log payment details to file"""
         timestamp = datetime.now().isoformat()
         
-        with open(self.payment_log_file, 'a') as f:
+        with self.lock, open(self.payment_log_file, 'a') as f:
             f.write(f"{timestamp},{payment_id},{amount_usd:.2f},{currency},{status},{customer_email},{description}\n")
         
         print(f"Payment logged: {status} - ${amount_usd:.2f} USD - {payment_id}")